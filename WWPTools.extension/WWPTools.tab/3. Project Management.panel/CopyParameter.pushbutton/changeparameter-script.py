@@ -1,4 +1,6 @@
 #! python3
+import re
+
 from pyrevit import revit, DB, script
 from Autodesk.Revit import UI
 # Get the active document
@@ -6,12 +8,22 @@ doc = revit.doc
 output = script.get_output()
 
 
+class WarningSwallower(DB.IFailuresPreprocessor):
+    """Dismiss transaction warnings so bulk edits do not stop on dialogs."""
+
+    def PreprocessFailures(self, failures_accessor):
+        failures_accessor.DeleteAllWarnings()
+        return DB.FailureProcessingResult.Continue
+
+
 def ask_for_inputs(param_names):
     """Single form for parameter mapping and text transforms."""
     try:
         import System
         from System.Drawing import Size
-        from System.Windows.Forms import Form, Label, TextBox, Button, DialogResult, ComboBox, ComboBoxStyle
+        from System.Windows.Forms import (
+            Form, Label, TextBox, Button, CheckBox, DialogResult, ComboBox, ComboBoxStyle
+        )
     except Exception as e:
         UI.TaskDialog.Show("Copy Parameter", f"Unable to load input dialog: {str(e)}")
         return None
@@ -19,7 +31,7 @@ def ask_for_inputs(param_names):
     form = Form()
     form.Text = "Copy and Transform Parameter"
     form.Width = 420
-    form.Height = 320
+    form.Height = 350
     form.StartPosition = System.Windows.Forms.FormStartPosition.CenterScreen
     form.FormBorderStyle = System.Windows.Forms.FormBorderStyle.FixedDialog
     form.MaximizeBox = False
@@ -34,6 +46,10 @@ def ask_for_inputs(param_names):
         ("Suffix", ""),
     ]
 
+    # Both parameter combos share one item array; layout runs once at the end.
+    name_items = System.Array[object](list(param_names)) if param_names else None
+    form.SuspendLayout()
+
     inputs = []
     top = 10
     for index, (label_text, default_value) in enumerate(labels):
@@ -49,8 +65,10 @@ def ask_for_inputs(param_names):
             control.Top = top - 2
             control.Width = 250
             control.DropDownStyle = ComboBoxStyle.DropDown
-            if param_names:
-                control.Items.AddRange(list(param_names))
+            if name_items is not None:
+                control.BeginUpdate()
+                control.Items.AddRange(name_items)
+                control.EndUpdate()
             control.Text = default_value
         else:
             control = TextBox()
@@ -64,6 +82,15 @@ def ask_for_inputs(param_names):
         inputs.append(control)
         top += 30
 
+    # Off by default so a literal comma in Find Text is still matched as typed.
+    multi_term = CheckBox()
+    multi_term.Left = 140
+    multi_term.Top = top - 2
+    multi_term.Width = 250
+    multi_term.Text = "Comma-separated Find/Replace lists"
+    form.Controls.Add(multi_term)
+    top += 30
+
     ok = Button()
     ok.Text = "OK"
     ok.Left = 230
@@ -81,6 +108,7 @@ def ask_for_inputs(param_names):
 
     form.Controls.Add(ok)
     form.Controls.Add(cancel)
+    form.ResumeLayout()
 
     result = form.ShowDialog()
     if result != DialogResult.OK:
@@ -93,8 +121,49 @@ def ask_for_inputs(param_names):
         "replace_text": inputs[3].Text,
         "prefix": inputs[4].Text,
         "suffix": inputs[5].Text,
+        "multi_term": bool(multi_term.Checked),
     }
 
+def build_replacer(find_text, replace_text, multi_term=False):
+    """
+    Build a find/replace function for one term or a list of terms.
+
+    With multi_term, Find Text and Replace Text are comma-separated lists
+    that pair up by position; an empty Replace Text entry deletes its find
+    term. A Replace Text without commas applies to every find term. All
+    terms are matched in a single pass of one compiled pattern.
+
+    Returns:
+        A function mapping a string to its replaced value
+
+    Raises:
+        ValueError: If a find term is empty, or if Replace Text is a list
+            whose length does not match the find terms
+    """
+    if not multi_term:
+        mapping = {find_text: replace_text}
+    else:
+        find_terms = find_text.split(",")
+        if not all(find_terms):
+            raise ValueError("Find Text has an empty term.")
+        if "," not in replace_text:
+            mapping = dict.fromkeys(find_terms, replace_text)
+        else:
+            replace_terms = replace_text.split(",")
+            if len(replace_terms) != len(find_terms):
+                raise ValueError(
+                    f"Find Text has {len(find_terms)} terms but Replace Text has {len(replace_terms)}."
+                )
+            mapping = dict(zip(find_terms, replace_terms))
+    # Longest terms first so overlapping terms prefer the longer match.
+    terms = sorted(mapping, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(term) for term in terms))
+
+    def replace(value):
+        return pattern.sub(lambda match: mapping[match.group(0)], value)
+
+    return replace
+
 def get_all_parameter_names(elements):
     """Return a sorted list of parameter names across all selected elements."""
     names = set()
@@ -116,27 +185,73 @@ def get_selected_elements():
         UI.TaskDialog.Show("Copy Parameter", f"Error getting selection: {str(e)}")
         return []
 
-def get_parameter_value(element, param_name):
+def find_first_parameter(elements, param_name):
+    """
+    Find a named parameter on the first element that has it.
+
+    Its Definition and StorageType are shared by the rest of a selection.
+
+    Returns:
+        The first matching parameter, or None if no element has it
+    """
+    for element in elements:
+        params = element.GetParameters(param_name)
+        if params.Count > 0:
+            return params[0]
+    return None
+
+def find_parameter(element, param_name, definition=None):
+    """
+    Find a parameter on an element by name.
+
+    GetParameters filters by name on the native side instead of building the
+    full parameter set the way LookupParameter does. When a Definition is
+    given it is tried first, since selections usually share one definition.
+
+    Args:
+        element: The Revit element
+        param_name: Name of the parameter to find
+        definition: Optional Definition resolved once for the selection
+
+    Returns:
+        The first matching parameter, or None if not found
+    """
+    param = element.get_Parameter(definition) if definition is not None else None
+    if param is None:
+        params = element.GetParameters(param_name)
+        param = params[0] if params.Count > 0 else None
+    return param
+
+def get_parameter_value(element, param_name, definition=None, use_string=None):
     """
     Get the value of a parameter from an element.
     
     Args:
         element: The Revit element
         param_name: Name of the parameter to retrieve
+        definition: Optional parameter Definition, see find_parameter
+        use_string: Optional "storage type is String" flag for definition;
+            only applied when the parameter is found through definition
         
     Returns:
         The parameter value as string, or None if not found
     """
     try:
-        param = element.LookupParameter(param_name)
-        if param is None:
-            return None
-        return str(param.AsString()) if param.StorageType == DB.StorageType.String else str(param.AsValueString())
+        param = element.get_Parameter(definition) if definition is not None else None
+        if param is None or use_string is None:
+            # A same-named parameter from another definition may store a
+            # different type, so its storage type is read here.
+            if param is None:
+                param = find_parameter(element, param_name)
+            if param is None:
+                return None
+            use_string = param.StorageType == DB.StorageType.String
+        return str(param.AsString()) if use_string else str(param.AsValueString())
     except Exception as e:
         print(f"Error getting parameter '{param_name}': {str(e)}")
         return None
 
-def set_parameter_value(element, param_name, value):
+def set_parameter_value(element, param_name, value, definition=None):
     """
     Set the value of a parameter on an element.
     
@@ -144,16 +259,20 @@ def set_parameter_value(element, param_name, value):
         element: The Revit element
         param_name: Name of the parameter to set
         value: The value to set
+        definition: Optional parameter Definition, see find_parameter
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        param = element.LookupParameter(param_name)
+        param = find_parameter(element, param_name, definition)
         if param is None:
             return False
         if param.IsReadOnly:
             return False
+        # Skip the write when a text parameter already holds the value.
+        if param.StorageType == DB.StorageType.String and (param.AsString() or "") == value:
+            return True
         param.Set(value)
         return True
     except Exception as e:
@@ -198,37 +317,73 @@ def main():
     # Process elements
     success_count = 0
     error_count = 0
+    log_lines = []
+    source_first = find_first_parameter(elements, source_param)
+    target_first = find_first_parameter(elements, target_param)
+    source_def = source_first.Definition if source_first else None
+    target_def = target_first.Definition if target_first else None
+    source_is_string = (
+        source_first.StorageType == DB.StorageType.String if source_first else None
+    )
+
+    # Build the text transform once instead of re-checking the options per element.
+    try:
+        replacer = (
+            build_replacer(find_text, replace_text, config.get("multi_term", False))
+            if find_text
+            else None
+        )
+    except ValueError as e:
+        UI.TaskDialog.Show("Copy Parameter", str(e))
+        return
+    if replacer and (prefix or suffix):
+        def transform(value):
+            return f"{prefix}{replacer(value)}{suffix}"
+    elif replacer:
+        transform = replacer
+    elif prefix or suffix:
+        def transform(value):
+            return f"{prefix}{value}{suffix}"
+    else:
+        def transform(value):
+            return value
     
     txn = DB.Transaction(doc, "Copy and Transform Parameter")
+    fail_opts = txn.GetFailureHandlingOptions()
+    fail_opts.SetFailuresPreprocessor(WarningSwallower())
+    fail_opts.SetClearAfterRollback(True)
+    txn.SetFailureHandlingOptions(fail_opts)
     txn.Start()
 
     for element in elements:
         # Get source parameter value
-        source_value = get_parameter_value(element, source_param)
+        source_value = get_parameter_value(
+            element, source_param, source_def, source_is_string
+        )
 
         if source_value is None:
-            print(f"Element {element.Id}: Parameter '{source_param}' not found")
+            log_lines.append(f"Element {element.Id}: Parameter '{source_param}' not found")
             error_count += 1
             continue
 
-        # Apply find/replace if specified
-        if find_text:
-            target_value = source_value.replace(find_text, replace_text)
-        else:
-            target_value = source_value
-
-        if prefix or suffix:
-            target_value = f"{prefix}{target_value}{suffix}"
+        # Apply find/replace and prefix/suffix
+        target_value = transform(source_value)
 
         # Set target parameter
-        if set_parameter_value(element, target_param, target_value):
-            print(f"Element {element.Id}: '{source_param}' -> '{target_param}' = '{target_value}'")
+        if set_parameter_value(
+            element, target_param, target_value, target_def
+        ):
+            log_lines.append(f"Element {element.Id}: '{source_param}' -> '{target_param}' = '{target_value}'")
             success_count += 1
         else:
-            print(f"Element {element.Id}: Failed to set parameter '{target_param}'")
+            log_lines.append(f"Element {element.Id}: Failed to set parameter '{target_param}'")
             error_count += 1
 
     txn.Commit()
+
+    # Write the per-element log in one call; each print updates the output window.
+    if log_lines:
+        print("\n".join(log_lines))
     
     # Show results
     message = f"Operation Complete:\n\nSuccessful: {success_count}\nFailed: {error_count}"
@@ -1,4 +1,6 @@
 #!python3
+from operator import attrgetter
+
 import clr
 
 from pyrevit import revit, DB, script
@@ -8,6 +10,7 @@ from Autodesk.Revit.UI import Selection as UISelection
 
 clr.AddReference("System.Windows.Forms")
 clr.AddReference("System.Drawing")
+from System import Array
 from System.Drawing import Point, Size
 from System.Collections.Generic import List
 from System.Windows.Forms import (
@@ -28,25 +31,42 @@ CONFIG_LAST_AREA_ID = "last_area_id"
 CONFIG_LAST_KEYPLAN_TEMPLATE_ID = "last_keyplan_template_id"
 CONFIG_LAST_FILL_TYPE_ID = "last_fill_type_id"
 
+_BIC_AREAS_INT = int(DB.BuiltInCategory.OST_Areas)
+_BOUNDARY_OPTS = DB.SpatialElementBoundaryOptions()
+_XYZ = DB.XYZ
+_Line_CreateBound = DB.Line.CreateBound
+_CurveLoop = DB.CurveLoop
+_get_name = attrgetter("Name")
+
+
+def _category_filter(bic_id):
+    class _CategoryFilter(UISelection.ISelectionFilter):
+        def AllowElement(self, element):
+            category = element.Category
+            return category is not None and element_id_value(category.Id) == bic_id
+
+        def AllowReference(self, reference, position):
+            return False
+
+    return _CategoryFilter()
+
 
 def pick_elements(bic, prompt):
     bic_id = int(bic)
     view = doc.ActiveView
     isolate_active = False
-    if bic_id == int(DB.BuiltInCategory.OST_Areas):
+    if bic_id == _BIC_AREAS_INT:
         try:
             view.IsolateCategoriesTemporary(List[DB.ElementId]([DB.ElementId(bic_id)]))
             isolate_active = True
         except Exception:
             isolate_active = False
     try:
-        refs = uidoc.Selection.PickObjects(UISelection.ObjectType.Element, prompt)
-        elems = []
-        for ref in refs:
-            elem = doc.GetElement(ref)
-            if elem and elem.Category and elem.Category.Id.IntegerValue == bic_id:
-                elems.append(elem)
-        return elems
+        refs = uidoc.Selection.PickObjects(
+            UISelection.ObjectType.Element, _category_filter(bic_id), prompt
+        )
+        elems = (doc.GetElement(ref) for ref in refs)
+        return [elem for elem in elems if element_is_category(elem, bic_id)]
     finally:
         if isolate_active:
             try:
@@ -58,24 +78,30 @@ def pick_elements(bic, prompt):
 def element_id_value(elem_id):
     if elem_id is None:
         return None
-    if hasattr(elem_id, "IntegerValue"):
+    try:
         return elem_id.IntegerValue
-    if hasattr(elem_id, "Value"):
+    except AttributeError:
+        pass
+    try:
         return elem_id.Value
+    except AttributeError:
+        pass
     try:
         return int(elem_id)
     except Exception:
         return None
 
 
-def element_is_category(elem, bic):
-    if not elem or not elem.Category:
+def element_is_category(elem, bic_id):
+    if not elem:
+        return False
+    category = elem.Category
+    if not category:
         return False
-    return elem.Category.Id.IntegerValue == int(bic)
+    return element_id_value(category.Id) == bic_id
 
 
-def unique_view_name(base_name):
-    existing = set(v.Name for v in DB.FilteredElementCollector(doc).OfClass(DB.View))
+def unique_view_name(base_name, existing):
     if base_name not in existing:
         return base_name
     index = 1
@@ -94,26 +120,46 @@ def _safe_elem_label(elem):
 
 
 def curve_loop_area_xy(curves):
-    pts = []
+    # Chord polygon through the curve start points (plus arc midpoints); only
+    # used to rank loops by size, so the exact curved area is not needed.
+    xs = []
+    ys = []
     for curve in curves:
-        for pt in curve.Tessellate():
-            if not pts or pt.DistanceTo(pts[-1]) > 1e-6:
-                pts.append(pt)
-    if len(pts) < 3:
+        pt = curve.GetEndPoint(0)
+        xs.append(pt.X)
+        ys.append(pt.Y)
+        if not isinstance(curve, DB.Line):
+            mid = curve.Evaluate(0.5, True)
+            xs.append(mid.X)
+            ys.append(mid.Y)
+    count = len(xs)
+    if count < 3:
         return 0.0
-    if pts[0].DistanceTo(pts[-1]) > 1e-6:
-        pts.append(pts[0])
     area = 0.0
-    for i in range(len(pts) - 1):
-        area += pts[i].X * pts[i + 1].Y - pts[i + 1].X * pts[i].Y
+    prev_x = xs[-1]
+    prev_y = ys[-1]
+    for i in range(count):
+        x = xs[i]
+        y = ys[i]
+        area += prev_x * y - x * prev_y
+        prev_x = x
+        prev_y = y
     return 0.5 * area
 
 
 def get_outer_boundary_loop(area):
-    opts = DB.SpatialElementBoundaryOptions()
-    loops = area.GetBoundarySegments(opts)
+    loops = area.GetBoundarySegments(_BOUNDARY_OPTS)
     if not loops:
         return None
+    if len(loops) == 1:
+        # No islands: the only loop is the outer boundary, skip the ranking.
+        loop = DB.CurveLoop()
+        try:
+            for seg in loops[0]:
+                loop.Append(seg.GetCurve())
+        except Exception:
+            return None
+        return loop
     best_curves = None
     best_area = -1.0
     for segs in loops:
@@ -140,21 +186,34 @@ def _rect_loop_from_bbox(bbox):
     max_pt = bbox.Max
     if not min_pt or not max_pt:
         return None
-    p1 = DB.XYZ(min_pt.X, min_pt.Y, min_pt.Z)
-    p2 = DB.XYZ(max_pt.X, min_pt.Y, min_pt.Z)
-    p3 = DB.XYZ(max_pt.X, max_pt.Y, min_pt.Z)
-    p4 = DB.XYZ(min_pt.X, max_pt.Y, min_pt.Z)
-    loop = DB.CurveLoop()
-    loop.Append(DB.Line.CreateBound(p1, p2))
-    loop.Append(DB.Line.CreateBound(p2, p3))
-    loop.Append(DB.Line.CreateBound(p3, p4))
-    loop.Append(DB.Line.CreateBound(p4, p1))
+    min_x, min_y, z = min_pt.X, min_pt.Y, min_pt.Z
+    max_x, max_y = max_pt.X, max_pt.Y
+    p1 = _XYZ(min_x, min_y, z)
+    p2 = _XYZ(max_x, min_y, z)
+    p3 = _XYZ(max_x, max_y, z)
+    p4 = _XYZ(min_x, max_y, z)
+    loop = _CurveLoop()
+    loop.Append(_Line_CreateBound(p1, p2))
+    loop.Append(_Line_CreateBound(p2, p3))
+    loop.Append(_Line_CreateBound(p3, p4))
+    loop.Append(_Line_CreateBound(p4, p1))
     return loop
 
 
+def _set_combo_items(combo, labels):
+    combo.BeginUpdate()
+    try:
+        combo.Items.Clear()
+        if labels:
+            combo.Items.AddRange(Array[object](labels))
+    finally:
+        combo.EndUpdate()
+
+
 class KeyplanForm(Form):
     def __init__(self, base_view, templates, fill_types, state):
         super(KeyplanForm, self).__init__()
+        self.SuspendLayout()
         self.Text = "Make Keyplans"
         self.StartPosition = FormStartPosition.CenterScreen
         self.Size = Size(640, 320)
@@ -180,8 +239,7 @@ class KeyplanForm(Form):
 
         current_y += 32
         self._area_label = Label()
-        area_label = self._state.get("area_label") or "(not selected)"
-        self._area_label.Text = "Areas: {}".format(area_label)
+        self.refresh_area_label()
         self._area_label.Location = Point(12, current_y)
         self._area_label.Size = Size(420, 20)
         self.Controls.Add(self._area_label)
@@ -237,10 +295,15 @@ class KeyplanForm(Form):
         self._load_template_choices()
         self._load_fill_choices()
 
+        self.ResumeLayout(False)
+        self.PerformLayout()
+
+    def refresh_area_label(self):
+        area_label = self._state.get("area_label") or "(not selected)"
+        self._area_label.Text = "Areas: {}".format(area_label)
+
     def _load_template_choices(self):
-        self._keyplan_template_combo.Items.Clear()
-        for template in self._templates:
-            self._keyplan_template_combo.Items.Add(template.Name)
+        _set_combo_items(self._keyplan_template_combo, list(map(_get_name, self._templates)))
         if self._templates:
             index = self._state.get("keyplan_template_index", 0)
             if isinstance(index, int) and 0 <= index < len(self._templates):
@@ -249,9 +312,7 @@ class KeyplanForm(Form):
                 self._keyplan_template_combo.SelectedIndex = 0
 
     def _load_fill_choices(self):
-        self._fill_combo.Items.Clear()
-        for fill_type in self._fill_types:
-            self._fill_combo.Items.Add(fill_type.Name)
+        _set_combo_items(self._fill_combo, list(map(_get_name, self._fill_types)))
         if self._fill_types:
             index = self._state.get("fill_type_index", 0)
             if isinstance(index, int) and 0 <= index < len(self._fill_types):
@@ -260,27 +321,31 @@ class KeyplanForm(Form):
                 self._fill_combo.SelectedIndex = 0
 
     def _on_pick_area(self, sender, args):
-        if self._keyplan_template_combo.SelectedIndex >= 0:
-            self._state["keyplan_template_index"] = self._keyplan_template_combo.SelectedIndex
-        if self._fill_combo.SelectedIndex >= 0:
-            self._state["fill_type_index"] = self._fill_combo.SelectedIndex
+        template_idx = self._keyplan_template_combo.SelectedIndex
+        fill_idx = self._fill_combo.SelectedIndex
+        if template_idx >= 0:
+            self._state["keyplan_template_index"] = template_idx
+        if fill_idx >= 0:
+            self._state["fill_type_index"] = fill_idx
         self.request_action = "area"
         self.DialogResult = DialogResult.Retry
         self.Close()
 
     def _on_create(self, sender, args):
+        template_idx = self._keyplan_template_combo.SelectedIndex
+        fill_idx = self._fill_combo.SelectedIndex
         if not self._state.get("areas"):
             uiutils.uiUtils_alert("Please pick at least one area.")
             return
-        if self._keyplan_template_combo.SelectedIndex < 0:
+        if template_idx < 0:
             uiutils.uiUtils_alert("Please select a keyplan view template.")
             return
-        if self._fill_combo.SelectedIndex < 0:
+        if fill_idx < 0:
             uiutils.uiUtils_alert("Please select a keyplan filled region type.")
             return
 
-        self.selected_keyplan_template = self._templates[self._keyplan_template_combo.SelectedIndex]
-        self.selected_fill_type = self._fill_types[self._fill_combo.SelectedIndex]
+        self.selected_keyplan_template = self._templates[template_idx]
+        self.selected_fill_type = self._fill_types[fill_idx]
 
         self.DialogResult = DialogResult.OK
         self.Close()
@@ -296,10 +361,11 @@ def main():
         uiutils.uiUtils_alert("Active view must be a plan view.", title="Make Keyplans")
         return
 
-    templates = [
-        v for v in DB.FilteredElementCollector(doc).OfClass(DB.View) if v.IsTemplate
-    ]
-    templates_sorted = sorted(templates, key=lambda v: v.Name)
+    # View templates are stored as View elements of the class they were made
+    # from, and only plan templates can be applied to a duplicated plan view.
+    views = DB.FilteredElementCollector(doc).OfClass(DB.ViewPlan).ToElements()
+    templates = [v for v in views if v.IsTemplate]
+    templates_sorted = sorted(templates, key=_get_name)
 
     fill_types = (
         DB.FilteredElementCollector(doc)
@@ -307,7 +373,9 @@ def main():
         .WhereElementIsElementType()
         .ToElements()
     )
-    fill_types_sorted = sorted(fill_types, key=lambda f: f.Name)
+    fill_types_sorted = sorted(fill_types, key=_get_name)
+    template_idx_by_id = {element_id_value(t.Id): i for i, t in enumerate(templates_sorted)}
+    fill_type_idx_by_id = {element_id_value(f.Id): i for i, f in enumerate(fill_types_sorted)}
 
     if not templates_sorted:
         uiutils.uiUtils_alert("No view templates found for this view type.", title="Make Keyplans")
@@ -327,26 +395,22 @@ def main():
     last_area_id = getattr(config, CONFIG_LAST_AREA_ID, None)
     if last_area_id:
         area_elem = doc.GetElement(DB.ElementId(int(last_area_id)))
-        if element_is_category(area_elem, DB.BuiltInCategory.OST_Areas):
+        if element_is_category(area_elem, _BIC_AREAS_INT):
             state["areas"] = [area_elem]
             state["area_label"] = area_elem.Name or area_elem.Id.IntegerValue
 
     last_keyplan_template_id = getattr(config, CONFIG_LAST_KEYPLAN_TEMPLATE_ID, None)
     if last_keyplan_template_id:
-        for idx, template in enumerate(templates_sorted):
-            if template.Id.IntegerValue == int(last_keyplan_template_id):
-                state["keyplan_template_index"] = idx
-                break
+        state["keyplan_template_index"] = template_idx_by_id.get(int(last_keyplan_template_id), 0)
 
     last_fill_type_id = getattr(config, CONFIG_LAST_FILL_TYPE_ID, None)
     if last_fill_type_id:
-        for idx, fill_type in enumerate(fill_types_sorted):
-            if fill_type.Id.IntegerValue == int(last_fill_type_id):
-                state["fill_type_index"] = idx
-                break
+        state["fill_type_index"] = fill_type_idx_by_id.get(int(last_fill_type_id), 0)
 
+    # The form is hidden (not disposed) while areas are picked and shown again
+    # afterwards, so combo selections survive without rebuilding the controls.
+    form = KeyplanForm(base_view, templates_sorted, fill_types_sorted, state)
     while True:
-        form = KeyplanForm(base_view, templates_sorted, fill_types_sorted, state)
         result = form.ShowDialog()
         if result == DialogResult.Retry:
             try:
@@ -362,8 +426,10 @@ def main():
                     state["area_label"] = "{} areas selected".format(len(areas))
                 else:
                     state["area_label"] = areas[0].Name or areas[0].Id.IntegerValue
+            form.refresh_area_label()
             continue
         if result != DialogResult.OK:
+            form.Dispose()
             return
 
         areas = state.get("areas") or []
@@ -380,49 +446,59 @@ def main():
         )
         script.save_config()
         break
+    form.Dispose()
 
-    results = []
+    created = []
+    failed = []
+    warnings_seen = {}
+    existing_names = set(
+        map(_get_name, DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements())
+    )
+    template_id = keyplan_template.Id
+    fill_type_id = keyplan_fill_type.Id
+    doc_GetElement = doc.GetElement
+    create_filled_region = DB.FilledRegion.Create
+    duplicate_option = DB.ViewDuplicateOption.Duplicate
+    fill_loops = List[DB.CurveLoop]()
     with revit.Transaction("Create Keyplan Views"):
         for area in areas:
             loop = get_outer_boundary_loop(area)
-            fallback_loop = None
+            used_bbox = False
             if not loop:
-                fallback_loop = _rect_loop_from_bbox(area.get_BoundingBox(base_view))
-                loop = fallback_loop
+                loop = _rect_loop_from_bbox(area.get_BoundingBox(base_view))
+                used_bbox = True
             if not loop:
-                results.append(
-                    {
-                        "area": area,
-                        "keyplan_view": None,
-                        "warnings": ["Could not create a filled region boundary."],
-                        "failed": True,
-                    }
-                )
+                failed.append(area)
+                warnings_seen.setdefault("Could not create a filled region boundary.", None)
                 continue
 
             base_label = area.Number or area.Name or str(area.Id.IntegerValue)
-            keyplan_view_id = base_view.Duplicate(DB.ViewDuplicateOption.Duplicate)
-            keyplan_view = doc.GetElement(keyplan_view_id)
-            keyplan_view.Name = unique_view_name("Keyplan - {}".format(base_label))
-            keyplan_view.ViewTemplateId = keyplan_template.Id
+            keyplan_view_id = base_view.Duplicate(duplicate_option)
+            keyplan_view = doc_GetElement(keyplan_view_id)
+            keyplan_view.Name = unique_view_name(
+                "Keyplan - {}".format(base_label), existing_names
+            )
+            existing_names.add(keyplan_view.Name)
+            keyplan_view.ViewTemplateId = template_id
             keyplan_view.CropBoxActive = True
             keyplan_view.CropBoxVisible = True
 
             create_errors = []
-            fill_loops = List[DB.CurveLoop]()
+            fill_loops.Clear()
             try:
                 fill_loops.Add(loop)
-                DB.FilledRegion.Create(doc, keyplan_fill_type.Id, keyplan_view.Id, fill_loops)
+                create_filled_region(doc, fill_type_id, keyplan_view.Id, fill_loops)
             except Exception:
-                if fallback_loop is None:
+                # The bounding box is only read once per area; if it already
+                # failed as the primary loop there is nothing to fall back to.
+                fallback_loop = None
+                if not used_bbox:
                     fallback_loop = _rect_loop_from_bbox(area.get_BoundingBox(base_view))
                 if fallback_loop:
                     try:
-                        fill_loops = List[DB.CurveLoop]()
+                        fill_loops.Clear()
                         fill_loops.Add(fallback_loop)
-                        DB.FilledRegion.Create(
-                            doc, keyplan_fill_type.Id, keyplan_view.Id, fill_loops
-                        )
+                        create_filled_region(doc, fill_type_id, keyplan_view.Id, fill_loops)
                         create_errors.append(
                             "Filled region loop was discontinuous; used area bounding box."
                         )
@@ -431,47 +507,28 @@ def main():
                 else:
                     create_errors.append("Filled region could not be created.")
 
-            results.append(
-                {
-                    "area": area,
-                    "keyplan_view": keyplan_view,
-                    "warnings": create_errors,
-                    "failed": False,
-                }
-            )
-
-    last_keyplan = None
-    for result in results:
-        if result.get("keyplan_view"):
-            last_keyplan = result.get("keyplan_view")
+            created.append((area, keyplan_view))
+            for warning in create_errors:
+                warnings_seen.setdefault(warning, None)
 
+    last_keyplan = created[-1][1] if created else None
     if last_keyplan:
         try:
             uidoc.RequestViewChange(last_keyplan)
         except Exception:
             uidoc.ActiveView = last_keyplan
 
-    created = [r for r in results if r.get("keyplan_view")]
-    failed = [r for r in results if r.get("failed")]
-    warnings = []
-    for result in results:
-        for warning in result.get("warnings") or []:
-            warnings.append(warning)
-
     lines = ["Created {} keyplan view(s):".format(len(created))]
-    for result in created:
-        view = result.get("keyplan_view")
-        area = result.get("area")
+    for area, view in created:
         lines.append("- {} ({})".format(view.Name, _safe_elem_label(area)))
     if failed:
         lines.append("")
         lines.append("Failed {} area(s):".format(len(failed)))
-        for result in failed:
-            area = result.get("area")
+        for area in failed:
             lines.append("- {}".format(_safe_elem_label(area)))
     message = "\n".join(lines)
-    if warnings:
-        message += "\n\nWarnings:\n" + "\n".join(sorted(set(warnings)))
+    if warnings_seen:
+        message += "\n\nWarnings:\n" + "\n".join(sorted(warnings_seen))
     uiutils.uiUtils_alert(message, title="Keyplans Created")
 
 
@@ -1,8 +1,17 @@
 #!python3
 import math
 import random
+from operator import attrgetter
 
 import clr
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    np = None
+    _HAS_NUMPY = False
+
 from pyrevit import revit, DB, script
 import WWP_uiUtils as uiutils
 from Autodesk.Revit.Exceptions import OperationCanceledException
@@ -10,6 +19,7 @@ from Autodesk.Revit.UI import Selection as UISelection
 
 clr.AddReference("System.Windows.Forms")
 clr.AddReference("System.Drawing")
+from System import Array
 from System.Drawing import Point, Size
 from System.Collections.Generic import List
 from System.Windows.Forms import (
@@ -38,50 +48,78 @@ CONFIG_LAST_KEYPLAN_ENABLED = "last_keyplan_enabled"
 CONFIG_LAST_KEYPLAN_TEMPLATE_ID = "last_keyplan_template_id"
 CONFIG_LAST_FILL_TYPE_ID = "last_fill_type_id"
 
+_BIC_AREAS_INT = int(DB.BuiltInCategory.OST_Areas)
+_BIC_DOORS_INT = int(DB.BuiltInCategory.OST_Doors)
+_BOUNDARY_OPTS = DB.SpatialElementBoundaryOptions()
+_XYZ = DB.XYZ
+_Line_CreateBound = DB.Line.CreateBound
+_CurveLoop = DB.CurveLoop
+_PARAM_NAME_CACHE = {}
+_SYMBOL_MATCH_CACHE = {}
+_get_name = attrgetter("Name")
+_OUTLINE_MIN_ATTR = None
+_OUTLINE_MAX_ATTR = None
+
+
+class _WarningSwallower(DB.IFailuresPreprocessor):
+    # Dismisses warnings so a batch does not stop on a dialog per area;
+    # errors still go through Revit's normal failure handling.
+    def PreprocessFailures(self, failures_accessor):
+        failures_accessor.DeleteAllWarnings()
+        return DB.FailureProcessingResult.Continue
+
+
+def _category_filter(bic_id):
+    class _CategoryFilter(UISelection.ISelectionFilter):
+        def AllowElement(self, element):
+            category = element.Category
+            return category is not None and element_id_value(category.Id) == bic_id
+
+        def AllowReference(self, reference, position):
+            return False
+
+    return _CategoryFilter()
+
 
 def pick_element(bic, prompt):
     bic_id = int(bic)
     view = doc.ActiveView
     isolate_active = False
-    if bic_id == int(DB.BuiltInCategory.OST_Areas):
+    if bic_id == _BIC_AREAS_INT:
         try:
             view.IsolateCategoriesTemporary(List[DB.ElementId]([DB.ElementId(bic_id)]))
             isolate_active = True
         except Exception:
             isolate_active = False
-    while True:
-        try:
-            ref = uidoc.Selection.PickObject(UISelection.ObjectType.Element, prompt)
-            elem = doc.GetElement(ref)
-            if elem and elem.Category and elem.Category.Id.IntegerValue == bic_id:
-                return elem
-            uiutils.uiUtils_alert("Selected element is not the expected category. Please try again.")
-        finally:
-            if isolate_active:
-                try:
-                    view.DisableTemporaryViewMode(DB.TemporaryViewMode.TemporaryHideIsolate)
-                except Exception:
-                    pass
+    try:
+        ref = uidoc.Selection.PickObject(
+            UISelection.ObjectType.Element, _category_filter(bic_id), prompt
+        )
+        return doc.GetElement(ref)
+    finally:
+        if isolate_active:
+            try:
+                view.DisableTemporaryViewMode(DB.TemporaryViewMode.TemporaryHideIsolate)
+            except Exception:
+                pass
 
 
 def pick_elements(bic, prompt):
     bic_id = int(bic)
     view = doc.ActiveView
     isolate_active = False
-    if bic_id == int(DB.BuiltInCategory.OST_Areas):
+    if bic_id == _BIC_AREAS_INT:
         try:
             view.IsolateCategoriesTemporary(List[DB.ElementId]([DB.ElementId(bic_id)]))
             isolate_active = True
         except Exception:
             isolate_active = False
     try:
-        refs = uidoc.Selection.PickObjects(UISelection.ObjectType.Element, prompt)
-        elems = []
-        for ref in refs:
-            elem = doc.GetElement(ref)
-            if elem and elem.Category and elem.Category.Id.IntegerValue == bic_id:
-                elems.append(elem)
-        return elems
+        refs = uidoc.Selection.PickObjects(
+            UISelection.ObjectType.Element, _category_filter(bic_id), prompt
+        )
+        elems = (doc.GetElement(ref) for ref in refs)
+        return [elem for elem in elems if element_is_category(elem, bic_id)]
     finally:
         if isolate_active:
             try:
@@ -90,9 +128,35 @@ def pick_elements(bic, prompt):
                 pass
 
 
+def _set_combo_items(combo, labels):
+    combo.BeginUpdate()
+    try:
+        combo.Items.Clear()
+        if labels:
+            combo.Items.AddRange(Array[object](labels))
+    finally:
+        combo.EndUpdate()
+
+
+class _SheetResult(object):
+    # One per processed area; slots keep batch results small.
+    __slots__ = ("area", "sheet", "marketing_view", "keyplan_view", "warnings", "failed")
+
+    def __init__(
+        self, area, sheet=None, marketing_view=None, keyplan_view=None, warnings=None, failed=False
+    ):
+        self.area = area
+        self.sheet = sheet
+        self.marketing_view = marketing_view
+        self.keyplan_view = keyplan_view
+        self.warnings = warnings or []
+        self.failed = failed
+
+
 class MarketingViewForm(Form):
     def __init__(self, base_view, templates, keyplan_templates, fill_types, titleblocks, state):
         super(MarketingViewForm, self).__init__()
+        self.SuspendLayout()
         self.Text = "Make Marketing View"
         self.StartPosition = FormStartPosition.CenterScreen
         self.Size = Size(720, 620)
@@ -260,10 +324,11 @@ class MarketingViewForm(Form):
         self._load_param_choices(self._state.get("area"))
         self._sync_keyplan_state()
 
+        self.ResumeLayout(False)
+        self.PerformLayout()
+
     def _load_template_choices(self):
-        self._template_combo.Items.Clear()
-        for template in self._templates:
-            self._template_combo.Items.Add(template.Name)
+        _set_combo_items(self._template_combo, list(map(_get_name, self._templates)))
         if self._templates:
             index = self._state.get("template_index", 0)
             if isinstance(index, int) and 0 <= index < len(self._templates):
@@ -272,9 +337,10 @@ class MarketingViewForm(Form):
                 self._template_combo.SelectedIndex = 0
 
     def _load_titleblock_choices(self):
-        self._titleblock_combo.Items.Clear()
-        for titleblock in self._titleblocks:
-            self._titleblock_combo.Items.Add("{}: {}".format(titleblock.FamilyName, titleblock.Name))
+        _set_combo_items(
+            self._titleblock_combo,
+            ["{}: {}".format(t.FamilyName, t.Name) for t in self._titleblocks],
+        )
         if self._titleblocks:
             index = self._state.get("titleblock_index", 0)
             if isinstance(index, int) and 0 <= index < len(self._titleblocks):
@@ -283,9 +349,9 @@ class MarketingViewForm(Form):
                 self._titleblock_combo.SelectedIndex = 0
 
     def _load_keyplan_template_choices(self):
-        self._keyplan_template_combo.Items.Clear()
-        for template in self._keyplan_templates:
-            self._keyplan_template_combo.Items.Add(template.Name)
+        _set_combo_items(
+            self._keyplan_template_combo, list(map(_get_name, self._keyplan_templates))
+        )
         if self._keyplan_templates:
             index = self._state.get("keyplan_template_index", 0)
             if isinstance(index, int) and 0 <= index < len(self._keyplan_templates):
@@ -294,9 +360,7 @@ class MarketingViewForm(Form):
                 self._keyplan_template_combo.SelectedIndex = 0
 
     def _load_fill_choices(self):
-        self._fill_combo.Items.Clear()
-        for fill_type in self._fill_types:
-            self._fill_combo.Items.Add(fill_type.Name)
+        _set_combo_items(self._fill_combo, list(map(_get_name, self._fill_types)))
         if self._fill_types:
             index = self._state.get("fill_type_index", 0)
             if isinstance(index, int) and 0 <= index < len(self._fill_types):
@@ -313,12 +377,9 @@ class MarketingViewForm(Form):
         self._sync_keyplan_state()
 
     def _load_param_choices(self, area):
-        names = get_parameter_names(area) if area else []
-        self._sheet_number_combo.Items.Clear()
-        self._sheet_name_combo.Items.Clear()
-        for name in names:
-            self._sheet_number_combo.Items.Add(name)
-            self._sheet_name_combo.Items.Add(name)
+        names = get_parameter_names(area) if area else ()
+        _set_combo_items(self._sheet_number_combo, names)
+        _set_combo_items(self._sheet_name_combo, names)
         if names:
             number_name = self._state.get("sheet_number_param")
             name_name = self._state.get("sheet_name_param")
@@ -334,15 +395,19 @@ class MarketingViewForm(Form):
         self._sheet_name_combo.Enabled = bool(names)
 
     def _on_pick_area(self, sender, args):
-        if self._template_combo.SelectedIndex >= 0:
-            self._state["template_index"] = self._template_combo.SelectedIndex
-        if self._keyplan_template_combo.SelectedIndex >= 0:
-            self._state["keyplan_template_index"] = self._keyplan_template_combo.SelectedIndex
-        if self._fill_combo.SelectedIndex >= 0:
-            self._state["fill_type_index"] = self._fill_combo.SelectedIndex
+        template_idx = self._template_combo.SelectedIndex
+        keyplan_template_idx = self._keyplan_template_combo.SelectedIndex
+        fill_idx = self._fill_combo.SelectedIndex
+        titleblock_idx = self._titleblock_combo.SelectedIndex
+        if template_idx >= 0:
+            self._state["template_index"] = template_idx
+        if keyplan_template_idx >= 0:
+            self._state["keyplan_template_index"] = keyplan_template_idx
+        if fill_idx >= 0:
+            self._state["fill_type_index"] = fill_idx
         self._state["keyplan_enabled"] = bool(self._keyplan_checkbox.Checked)
-        if self._titleblock_combo.SelectedIndex >= 0:
-            self._state["titleblock_index"] = self._titleblock_combo.SelectedIndex
+        if titleblock_idx >= 0:
+            self._state["titleblock_index"] = titleblock_idx
         if self._sheet_number_combo.SelectedIndex >= 0:
             self._state["sheet_number_param"] = self._sheet_number_combo.SelectedItem
         if self._sheet_name_combo.SelectedIndex >= 0:
@@ -352,37 +417,40 @@ class MarketingViewForm(Form):
         self.Close()
 
     def _on_create(self, sender, args):
+        template_idx = self._template_combo.SelectedIndex
+        titleblock_idx = self._titleblock_combo.SelectedIndex
+        keyplan_template_idx = self._keyplan_template_combo.SelectedIndex
+        fill_idx = self._fill_combo.SelectedIndex
+        create_keyplan = bool(self._keyplan_checkbox.Checked)
         if not self.selected_area and not self._state.get("areas"):
             uiutils.uiUtils_alert("Please pick at least one area.")
             return
         if self._sheet_number_combo.SelectedIndex < 0 or self._sheet_name_combo.SelectedIndex < 0:
             uiutils.uiUtils_alert("Please select sheet parameter mappings.")
             return
-        if self._template_combo.SelectedIndex < 0:
+        if template_idx < 0:
             uiutils.uiUtils_alert("Please select a marketing view template.")
             return
-        if self._titleblock_combo.SelectedIndex < 0:
+        if titleblock_idx < 0:
             uiutils.uiUtils_alert("Please select a titleblock.")
             return
-        if self._keyplan_checkbox.Checked:
-            if self._keyplan_template_combo.SelectedIndex < 0:
+        if create_keyplan:
+            if keyplan_template_idx < 0:
                 uiutils.uiUtils_alert("Please select a keyplan view template.")
                 return
-            if self._fill_combo.SelectedIndex < 0:
+            if fill_idx < 0:
                 uiutils.uiUtils_alert("Please select a keyplan filled region type.")
                 return
 
         self.selected_sheet_number_param = self._sheet_number_combo.SelectedItem
         self.selected_sheet_name_param = self._sheet_name_combo.SelectedItem
-        self.selected_template = self._templates[self._template_combo.SelectedIndex]
-        if self._keyplan_checkbox.Checked:
-            self.selected_keyplan_template = self._keyplan_templates[
-                self._keyplan_template_combo.SelectedIndex
-            ]
-            self.selected_fill_type = self._fill_types[self._fill_combo.SelectedIndex]
-        self.selected_titleblock = self._titleblocks[self._titleblock_combo.SelectedIndex]
+        self.selected_template = self._templates[template_idx]
+        if create_keyplan:
+            self.selected_keyplan_template = self._keyplan_templates[keyplan_template_idx]
+            self.selected_fill_type = self._fill_types[fill_idx]
+        self.selected_titleblock = self._titleblocks[titleblock_idx]
         self.selected_overwrite = bool(self._overwrite_checkbox.Checked)
-        self.selected_create_keyplan = bool(self._keyplan_checkbox.Checked)
+        self.selected_create_keyplan = create_keyplan
 
         self.DialogResult = DialogResult.OK
         self.Close()
@@ -395,7 +463,8 @@ class MarketingViewForm(Form):
 def get_param_value(elem, name):
     if not name:
         return ""
-    param = elem.LookupParameter(name)
+    params = elem.GetParameters(name)
+    param = params[0] if params and params.Count else None
     if not param:
         return ""
     if param.StorageType == DB.StorageType.String:
@@ -409,35 +478,107 @@ def get_param_value(elem, name):
     return ""
 
 
-def curve_loop_area_xy(curves):
-    pts = []
+def _tessellate_xy(curves):
+    # Returns the deduplicated, closed XY outline of the curves plus the Z of
+    # the first point. Coordinates are compared as plain floats (squared
+    # distance) instead of calling XYZ.DistanceTo per point. With NumPy the
+    # points are written straight into a growable (N, 2) buffer.
+    buf = np.empty((256, 2), dtype=np.float64) if _HAS_NUMPY else None
+    size = 256
+    xs = []
+    ys = []
+    k = 0
+    first_x = first_y = first_z = 0.0
+    prev_x = prev_y = prev_z = None
     for curve in curves:
         for pt in curve.Tessellate():
-            if not pts or pt.DistanceTo(pts[-1]) > 1e-6:
-                pts.append(pt)
-    if len(pts) < 3:
+            x = pt.X
+            y = pt.Y
+            z = pt.Z
+            if prev_x is None:
+                first_x, first_y, first_z = x, y, z
+            else:
+                dx = x - prev_x
+                dy = y - prev_y
+                dz = z - prev_z
+                if dx * dx + dy * dy + dz * dz <= 1e-12:
+                    continue
+            if buf is not None:
+                if k == size:
+                    size *= 2
+                    buf = np.resize(buf, (size, 2))
+                buf[k, 0] = x
+                buf[k, 1] = y
+            else:
+                xs.append(x)
+                ys.append(y)
+            k += 1
+            prev_x, prev_y, prev_z = x, y, z
+    if k >= 3:
+        dx = first_x - prev_x
+        dy = first_y - prev_y
+        dz = first_z - prev_z
+        if dx * dx + dy * dy + dz * dz > 1e-12:
+            if buf is not None:
+                if k == size:
+                    buf = np.resize(buf, (size + 1, 2))
+                buf[k, 0] = first_x
+                buf[k, 1] = first_y
+            else:
+                xs.append(first_x)
+                ys.append(first_y)
+            k += 1
+    if buf is not None:
+        buf = buf[:k]
+        return buf[:, 0], buf[:, 1], first_z
+    return xs, ys, first_z
+
+
+def curve_loop_area_xy(curves):
+    xs, ys, _ = _tessellate_xy(curves)
+    if len(xs) < 3:
         return 0.0
-    if pts[0].DistanceTo(pts[-1]) > 1e-6:
-        pts.append(pts[0])
+    if _HAS_NUMPY:
+        x = np.asarray(xs, dtype=np.float64)
+        y = np.asarray(ys, dtype=np.float64)
+        return 0.5 * float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
     area = 0.0
-    for i in range(len(pts) - 1):
-        area += pts[i].X * pts[i + 1].Y - pts[i + 1].X * pts[i].Y
+    for i in range(len(xs) - 1):
+        area += xs[i] * ys[i + 1] - xs[i + 1] * ys[i]
     return 0.5 * area
 
 
 def get_outer_boundary_loop(area):
-    opts = DB.SpatialElementBoundaryOptions()
-    loops = area.GetBoundarySegments(opts)
+    loops = area.GetBoundarySegments(_BOUNDARY_OPTS)
     if not loops:
         return None
+    if len(loops) == 1:
+        # No islands: the only loop is the outer boundary, skip the ranking.
+        loop = DB.CurveLoop()
+        try:
+            for seg in loops[0]:
+                loop.Append(seg.GetCurve())
+        except Exception:
+            return None
+        return loop
+    # Revit returns the outer boundary counter-clockwise (positive signed
+    # area) and islands clockwise, so the largest signed area is the outer
+    # loop. Fall back to the largest absolute area if no loop is positive.
     best_curves = None
-    best_area = -1.0
+    best_signed = 0.0
+    abs_curves = None
+    abs_area = -1.0
     for segs in loops:
         curves = [seg.GetCurve() for seg in segs]
-        area_val = abs(curve_loop_area_xy(curves))
-        if area_val > best_area:
-            best_area = area_val
+        signed = curve_loop_area_xy(curves)
+        if signed > best_signed:
+            best_signed = signed
             best_curves = curves
+        if best_curves is None and abs(signed) > abs_area:
+            abs_area = abs(signed)
+            abs_curves = curves
+    if best_curves is None:
+        best_curves = abs_curves
     if not best_curves:
         return None
     loop = DB.CurveLoop()
@@ -467,6 +608,18 @@ def clear_scope_box(view):
         param.Set(DB.ElementId.InvalidElementId)
 
 
+def _find_crop_element(view):
+    try:
+        target_name = getattr(view, "Name", None)
+        if target_name:
+            for element in DB.FilteredElementCollector(doc, view.Id).ToElements():
+                if getattr(element, "Name", None) == target_name:
+                    return element
+    except Exception:
+        return None
+    return None
+
+
 def rotate_view_to_door(view, door):
     facing = door.FacingOrientation
     vec = DB.XYZ(facing.X, facing.Y, 0.0)
@@ -474,35 +627,38 @@ def rotate_view_to_door(view, door):
         return False, "Door facing vector is zero."
     vec = vec.Normalize()
 
-    y_axis = DB.XYZ.BasisY
-    z_axis = DB.XYZ.BasisZ
-    angle = math.atan2(y_axis.CrossProduct(vec).DotProduct(z_axis), y_axis.DotProduct(vec))
+    # Signed angle from +Y to vec about +Z; the cross/dot products reduce to
+    # (-vec.X, vec.Y) for a vector in the XY plane.
+    angle = math.atan2(-vec.X, vec.Y)
     if abs(angle) < 1e-9:
         return False, "Computed rotation angle is near zero."
 
+    # Regenerate only when the crop box visibility actually changes, or when
+    # the crop element cannot be found without it.
+    regenerated = False
     try:
-        view.CropBoxVisible = True
+        was_visible = view.CropBoxVisible
     except Exception:
-        pass
-    try:
-        doc.Regenerate()
-    except Exception:
-        pass
+        was_visible = False
+    if not was_visible:
+        try:
+            view.CropBoxVisible = True
+            doc.Regenerate()
+            regenerated = True
+        except Exception:
+            pass
 
-    crop_elem = None
-    try:
-        target_name = getattr(view, "Name", None)
-        if target_name:
-            elements = list(DB.FilteredElementCollector(doc, view.Id).ToElements())
-            for element in elements:
-                if getattr(element, "Name", None) == target_name:
-                    crop_elem = element
-                    break
-    except Exception:
-        crop_elem = None
+    crop_elem = _find_crop_element(view)
+    if crop_elem is None and not regenerated:
+        try:
+            doc.Regenerate()
+        except Exception:
+            pass
+        else:
+            crop_elem = _find_crop_element(view)
 
     if crop_elem:
-        axis = DB.Line.CreateUnbound(view.Origin, z_axis)
+        axis = DB.Line.CreateUnbound(view.Origin, DB.XYZ.BasisZ)
         DB.ElementTransformUtils.RotateElement(doc, crop_elem.Id, axis, angle)
         return True, "Rotated crop element {} by {:.2f} deg.".format(
             crop_elem.Id.IntegerValue, math.degrees(angle)
@@ -524,32 +680,48 @@ def rotate_view_to_door(view, door):
     return False, reason
 
 
-def unique_view_name(base_name):
-    existing = set(v.Name for v in DB.FilteredElementCollector(doc).OfClass(DB.View))
+def collect_view_names():
+    return set(map(_get_name, DB.FilteredElementCollector(doc).OfClass(DB.View)))
+
+
+def collect_sheets_by_number():
+    sheets = {}
+    for sheet in DB.FilteredElementCollector(doc).OfClass(DB.ViewSheet).ToElements():
+        if sheet.SheetNumber:
+            sheets[sheet.SheetNumber] = sheet
+    return sheets
+
+
+def unique_view_name(base_name, existing=None, hints=None):
+    # hints maps a base name to the next suffix worth trying, so repeated
+    # collisions within a batch do not rescan the suffixes already taken.
+    if existing is None:
+        existing = collect_view_names()
     if base_name not in existing:
         return base_name
-    index = 1
+    index = hints.get(base_name, 1) if hints is not None else 1
     while True:
         candidate = "{} ({})".format(base_name, index)
         if candidate not in existing:
+            if hints is not None:
+                hints[base_name] = index + 1
             return candidate
         index += 1
 
 
-def unique_sheet_number(base_number):
+def unique_sheet_number(base_number, existing=None, hints=None):
     if not base_number:
         return ""
-    existing = set(
-        s.SheetNumber
-        for s in DB.FilteredElementCollector(doc).OfClass(DB.ViewSheet)
-        if s.SheetNumber
-    )
+    if existing is None:
+        existing = collect_sheets_by_number()
     if base_number not in existing:
         return base_number
-    index = 1
+    index = hints.get(base_number, 1) if hints is not None else 1
     while True:
         candidate = "{}-copy{}".format(base_number, "" if index == 1 else str(index))
         if candidate not in existing:
+            if hints is not None:
+                hints[base_number] = index + 1
             return candidate
         index += 1
 
@@ -557,28 +729,62 @@ def unique_sheet_number(base_number):
 def element_id_value(elem_id):
     if elem_id is None:
         return None
-    if hasattr(elem_id, "IntegerValue"):
+    try:
         return elem_id.IntegerValue
-    if hasattr(elem_id, "Value"):
+    except AttributeError:
+        pass
+    try:
         return elem_id.Value
+    except AttributeError:
+        pass
     try:
         return int(elem_id)
     except Exception:
         return None
 
 
-def element_is_category(elem, bic):
-    if not elem or not elem.Category:
+def _index_by_id(elements):
+    return {element_id_value(e.Id): i for i, e in enumerate(elements)}
+
+
+def _saved_index(index_by_id, saved_id):
+    if not saved_id:
+        return 0
+    try:
+        return index_by_id.get(int(saved_id), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def element_is_category(elem, bic_id):
+    if not elem:
+        return False
+    category = elem.Category
+    if not category:
         return False
-    return elem.Category.Id.IntegerValue == int(bic)
+    return element_id_value(category.Id) == bic_id
 
 
 def get_parameter_names(elem):
-    names = set()
-    for param in elem.Parameters:
-        if param.Definition and param.Definition.Name:
-            names.add(param.Definition.Name)
-    return sorted(names)
+    # Areas have no type (GetTypeId is InvalidElementId), so the area scheme
+    # stands in for it; elements sharing a category, type and scheme expose
+    # the same parameter set.
+    category = elem.Category
+    scheme = getattr(elem, "AreaScheme", None)
+    key = (
+        element_id_value(category.Id) if category is not None else 0,
+        element_id_value(elem.GetTypeId()),
+        element_id_value(scheme.Id) if scheme is not None else 0,
+    )
+    names = _PARAM_NAME_CACHE.get(key)
+    if names is None:
+        found = set()
+        for param in elem.GetOrderedParameters():
+            if param.Definition and param.Definition.Name:
+                found.add(param.Definition.Name)
+        names = tuple(sorted(found))
+        _PARAM_NAME_CACHE[key] = names
+    return names
 
 
 def _safe_elem_label(elem):
@@ -598,41 +804,41 @@ def _report_sheet_number(sheet):
     return "MARKETING&{}".format(random.randint(1000, 9999))
 
 def _door_name_matches(door):
-    def _param_string(param):
-        try:
-            if param is None:
-                return ""
-            if param.StorageType == DB.StorageType.String:
-                return param.AsString() or ""
-            return param.AsValueString() or ""
-        except Exception:
-            return ""
-
-    try:
-        name = door.Name or ""
-    except Exception:
-        name = ""
     symbol = None
     try:
         symbol = door.Symbol
     except Exception:
         symbol = None
-    parts = [name]
-    try:
-        parts.append(_param_string(door.get_Parameter(DB.BuiltInParameter.SYMBOL_NAME_PARAM)))
-    except Exception:
-        pass
-    if symbol:
-        try:
-            parts.append(symbol.Name or "")
-        except Exception:
-            pass
+    symbol_id = element_id_value(symbol.Id) if symbol else None
+    matched = _SYMBOL_MATCH_CACHE.get(symbol_id) if symbol_id is not None else None
+    if matched is None:
+        # Type and family names are shared by every instance of the symbol.
+        parts = []
+        # SYMBOL_NAME_PARAM is always a string parameter.
         try:
-            parts.append(symbol.FamilyName or "")
+            param = door.get_Parameter(DB.BuiltInParameter.SYMBOL_NAME_PARAM)
+            parts.append((param.AsString() or "") if param else "")
         except Exception:
             pass
-    joined = " ".join([p for p in parts if p]).lower()
-    return "entry" in joined
+        if symbol:
+            try:
+                parts.append(symbol.Name or "")
+            except Exception:
+                pass
+            try:
+                parts.append(symbol.FamilyName or "")
+            except Exception:
+                pass
+        matched = "entry" in " ".join([p for p in parts if p]).lower()
+        if symbol_id is not None:
+            _SYMBOL_MATCH_CACHE[symbol_id] = matched
+    if matched:
+        return True
+    try:
+        name = door.Name or ""
+    except Exception:
+        name = ""
+    return "entry" in name.lower()
 
 
 def _door_location_point(door):
@@ -662,46 +868,72 @@ def _door_points_for_check(door):
                 points.append(curve.GetEndPoint(1))
                 points.append(curve.Evaluate(0.5, True))
     except Exception:
-        return points
+        pass
+    return points
 
+
+def _door_offset_points(door, points):
+    # Points one foot either side of the door along its facing direction, for
+    # doors hosted in the area boundary wall.
+    offset_points = []
     try:
         facing = door.FacingOrientation
         if facing and not facing.IsZeroLength():
-            facing = facing.Normalize()
-            offset = facing.Multiply(1.0)
-            points.extend([pt + offset for pt in points])
-            points.extend([pt - offset for pt in points])
+            offset = facing.Normalize()
+            offset_points.extend([pt + offset for pt in points])
+            offset_points.extend([pt - offset for pt in points])
     except Exception:
         pass
+    return offset_points
 
-    return points
+
+def _any_point_in_area(area, points, bbox):
+    for pt in points:
+        if bbox is not None:
+            bb_min, bb_max = bbox
+            if not (
+                bb_min[0] <= pt.X <= bb_max[0] and bb_min[1] <= pt.Y <= bb_max[1]
+            ):
+                continue
+        try:
+            if area.IsPointInArea(pt):
+                return True
+        except Exception:
+            continue
+    return False
 
 
 def _centroid_from_loop(loop):
     try:
-        pts = []
-        for curve in loop:
-            for pt in curve.Tessellate():
-                if not pts or pt.DistanceTo(pts[-1]) > 1e-6:
-                    pts.append(pt)
-        if len(pts) < 3:
+        xs, ys, z = _tessellate_xy(loop)
+        if len(xs) < 3:
             return None
-        if pts[0].DistanceTo(pts[-1]) > 1e-6:
-            pts.append(pts[0])
-        area = 0.0
-        cx = 0.0
-        cy = 0.0
-        for i in range(len(pts) - 1):
-            cross = pts[i].X * pts[i + 1].Y - pts[i + 1].X * pts[i].Y
-            area += cross
-            cx += (pts[i].X + pts[i + 1].X) * cross
-            cy += (pts[i].Y + pts[i + 1].Y) * cross
+        if _HAS_NUMPY:
+            x = np.asarray(xs, dtype=np.float64)
+            y = np.asarray(ys, dtype=np.float64)
+            x0 = x[:-1]
+            y0 = y[:-1]
+            x1 = x[1:]
+            y1 = y[1:]
+            cross = x0 * y1 - x1 * y0
+            area = float(cross.sum())
+            cx = float(((x0 + x1) * cross).sum())
+            cy = float(((y0 + y1) * cross).sum())
+        else:
+            area = 0.0
+            cx = 0.0
+            cy = 0.0
+            for i in range(len(xs) - 1):
+                cross = xs[i] * ys[i + 1] - xs[i + 1] * ys[i]
+                area += cross
+                cx += (xs[i] + xs[i + 1]) * cross
+                cy += (ys[i] + ys[i + 1]) * cross
         if abs(area) < 1e-9:
             return None
         area *= 0.5
         cx = cx / (6.0 * area)
         cy = cy / (6.0 * area)
-        return DB.XYZ(cx, cy, pts[0].Z)
+        return DB.XYZ(cx, cy, z)
     except Exception:
         return None
 
@@ -723,27 +955,31 @@ def _rect_loop_from_bbox(bbox):
     max_pt = bbox.Max
     if not min_pt or not max_pt:
         return None
-    p1 = DB.XYZ(min_pt.X, min_pt.Y, min_pt.Z)
-    p2 = DB.XYZ(max_pt.X, min_pt.Y, min_pt.Z)
-    p3 = DB.XYZ(max_pt.X, max_pt.Y, min_pt.Z)
-    p4 = DB.XYZ(min_pt.X, max_pt.Y, min_pt.Z)
-    loop = DB.CurveLoop()
-    loop.Append(DB.Line.CreateBound(p1, p2))
-    loop.Append(DB.Line.CreateBound(p2, p3))
-    loop.Append(DB.Line.CreateBound(p3, p4))
-    loop.Append(DB.Line.CreateBound(p4, p1))
+    min_x, min_y, z = min_pt.X, min_pt.Y, min_pt.Z
+    max_x, max_y = max_pt.X, max_pt.Y
+    p1 = _XYZ(min_x, min_y, z)
+    p2 = _XYZ(max_x, min_y, z)
+    p3 = _XYZ(max_x, max_y, z)
+    p4 = _XYZ(min_x, max_y, z)
+    loop = _CurveLoop()
+    loop.Append(_Line_CreateBound(p1, p2))
+    loop.Append(_Line_CreateBound(p2, p3))
+    loop.Append(_Line_CreateBound(p3, p4))
+    loop.Append(_Line_CreateBound(p4, p1))
     return loop
 
 
 def _get_titleblock_bounds(sheet):
-    titleblocks = (
+    titleblock_ids = (
         DB.FilteredElementCollector(doc, sheet.Id)
         .OfCategory(DB.BuiltInCategory.OST_TitleBlocks)
         .WhereElementIsNotElementType()
-        .ToElements()
+        .ToElementIds()
     )
-    for titleblock in titleblocks:
+    # Resolve titleblocks one at a time; the first usable bbox wins.
+    for titleblock_id in titleblock_ids:
         try:
+            titleblock = doc.GetElement(titleblock_id)
             bbox = titleblock.get_BoundingBox(sheet) or titleblock.get_BoundingBox(None)
             if bbox:
                 return bbox.Min, bbox.Max
@@ -756,38 +992,58 @@ def _get_titleblock_bounds(sheet):
     )
 
 
-def _clamp_viewport_center(viewport, target_center, bounds_min, bounds_max):
-    try:
-        outline = viewport.GetBoxOutline()
-    except Exception:
-        viewport.SetBoxCenter(DB.XYZ(target_center.X, target_center.Y, 0.0))
-        return
-
-    outline_min = getattr(outline, "Min", None) or getattr(outline, "MinimumPoint", None)
-    outline_max = getattr(outline, "Max", None) or getattr(outline, "MaximumPoint", None)
-    if outline_min is None or outline_max is None:
-        outline_min = getattr(outline, "Minimum", None)
-        outline_max = getattr(outline, "Maximum", None)
-    if outline_min is None or outline_max is None:
-        viewport.SetBoxCenter(DB.XYZ(target_center.X, target_center.Y, 0.0))
-        return
-
-    half_w = (outline_max.X - outline_min.X) / 2.0
-    half_h = (outline_max.Y - outline_min.Y) / 2.0
-    available_w = bounds_max.X - bounds_min.X
-    available_h = bounds_max.Y - bounds_min.Y
-
-    if available_w < 2.0 * half_w:
-        center_x = (bounds_min.X + bounds_max.X) / 2.0
-    else:
-        center_x = max(bounds_min.X + half_w, min(target_center.X, bounds_max.X - half_w))
-
-    if available_h < 2.0 * half_h:
-        center_y = (bounds_min.Y + bounds_max.Y) / 2.0
-    else:
-        center_y = max(bounds_min.Y + half_h, min(target_center.Y, bounds_max.Y - half_h))
-
-    viewport.SetBoxCenter(DB.XYZ(center_x, center_y, 0.0))
+def _outline_min_max(outline):
+    # The corner attribute names differ between outline types; probe them on
+    # the first viewport and read the cached names afterwards.
+    global _OUTLINE_MIN_ATTR, _OUTLINE_MAX_ATTR
+    if _OUTLINE_MIN_ATTR is None:
+        for min_attr, max_attr in (
+            ("Min", "Max"),
+            ("MinimumPoint", "MaximumPoint"),
+            ("Minimum", "Maximum"),
+        ):
+            if (
+                getattr(outline, min_attr, None) is not None
+                and getattr(outline, max_attr, None) is not None
+            ):
+                _OUTLINE_MIN_ATTR = min_attr
+                _OUTLINE_MAX_ATTR = max_attr
+                break
+        else:
+            return None, None
+    return getattr(outline, _OUTLINE_MIN_ATTR, None), getattr(outline, _OUTLINE_MAX_ATTR, None)
+
+
+def _clamped_centers(layout, bounds):
+    # layout rows are (target_x, target_y, half_w, half_h); bounds is the
+    # titleblock extent as plain floats (xmin, ymin, xmax, ymax). Each target is
+    # clamped so the viewport stays inside the bounds, or centred when it does
+    # not fit.
+    xmin, ymin, xmax, ymax = bounds
+    mid_x = (xmin + xmax) / 2.0
+    mid_y = (ymin + ymax) / 2.0
+    if _HAS_NUMPY:
+        rows = np.array(layout, dtype=np.float64).reshape(-1, 4)
+        tx, ty, hw, hh = rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]
+        cx = np.where(
+            xmax - xmin < 2.0 * hw, mid_x, np.maximum(xmin + hw, np.minimum(tx, xmax - hw))
+        )
+        cy = np.where(
+            ymax - ymin < 2.0 * hh, mid_y, np.maximum(ymin + hh, np.minimum(ty, ymax - hh))
+        )
+        return list(zip(cx.tolist(), cy.tolist()))
+    centers = []
+    for tx, ty, hw, hh in layout:
+        if xmax - xmin < 2.0 * hw:
+            cx = mid_x
+        else:
+            cx = max(xmin + hw, min(tx, xmax - hw))
+        if ymax - ymin < 2.0 * hh:
+            cy = mid_y
+        else:
+            cy = max(ymin + hh, min(ty, ymax - hh))
+        centers.append((cx, cy))
+    return centers
 
 
 def _viewport_half_size(viewport):
@@ -796,29 +1052,74 @@ def _viewport_half_size(viewport):
     except Exception:
         return None
 
-    outline_min = getattr(outline, "Min", None) or getattr(outline, "MinimumPoint", None)
-    outline_max = getattr(outline, "Max", None) or getattr(outline, "MaximumPoint", None)
-    if outline_min is None or outline_max is None:
-        outline_min = getattr(outline, "Minimum", None)
-        outline_max = getattr(outline, "Maximum", None)
+    outline_min, outline_max = _outline_min_max(outline)
     if outline_min is None or outline_max is None:
         return None
     return (outline_max.X - outline_min.X) / 2.0, (outline_max.Y - outline_min.Y) / 2.0
 
 
-def find_entry_door_in_area(area, view):
+def _entry_door_filter():
+    # Match on the door types first (few elements) and seed the per-symbol
+    # cache, so only instances of entry door types are materialized.
+    symbol_ids = []
+    for symbol in (
+        DB.FilteredElementCollector(doc)
+        .OfCategory(DB.BuiltInCategory.OST_Doors)
+        .WhereElementIsElementType()
+        .ToElements()
+    ):
+        parts = [symbol.Name or "", getattr(symbol, "FamilyName", "") or ""]
+        matched = "entry" in " ".join(parts).lower()
+        _SYMBOL_MATCH_CACHE[element_id_value(symbol.Id)] = matched
+        if matched:
+            symbol_ids.append(symbol.Id)
+    if not symbol_ids:
+        return None
+    filters = List[DB.ElementFilter]([DB.FamilyInstanceFilter(doc, sid) for sid in symbol_ids])
+    if filters.Count == 1:
+        return filters[0]
+    return DB.LogicalOrFilter(filters)
+
+
+def collect_doors(view):
+    collector = (
+        DB.FilteredElementCollector(doc, view.Id)
+        .OfCategory(DB.BuiltInCategory.OST_Doors)
+        .WhereElementIsNotElementType()
+    )
+    try:
+        entry_filter = _entry_door_filter()
+        if entry_filter is None:
+            return []
+        door_ids = collector.WherePasses(entry_filter).ToElementIds()
+    except Exception:
+        try:
+            door_ids = collector.ToElementIds()
+        except Exception:
+            return []
+    get_element = doc.GetElement
+    return [get_element(door_id) for door_id in door_ids]
+
+
+def find_entry_door_in_area(area, view, doors=None):
     if area is None:
         return None
 
+    if doors is None:
+        doors = collect_doors(view)
+
+    # Cheap XY bounding-box reject before the IsPointInArea query.
+    bbox = None
     try:
-        collector = DB.FilteredElementCollector(doc, view.Id)
-        doors = (
-            collector.OfCategory(DB.BuiltInCategory.OST_Doors)
-            .WhereElementIsNotElementType()
-            .ToElements()
-        )
+        bb = area.get_BoundingBox(view)
+        if bb:
+            eps = 1e-6
+            bbox = (
+                (bb.Min.X - eps, bb.Min.Y - eps),
+                (bb.Max.X + eps, bb.Max.Y + eps),
+            )
     except Exception:
-        doors = []
+        bbox = None
 
     matches = []
     for door in doors:
@@ -827,13 +1128,10 @@ def find_entry_door_in_area(area, view):
         points = _door_points_for_check(door)
         if not points:
             continue
-        for pt in points:
-            try:
-                if area.IsPointInArea(pt):
-                    matches.append(door)
-                    break
-            except Exception:
-                continue
+        if _any_point_in_area(area, points, bbox) or _any_point_in_area(
+            area, _door_offset_points(door, points), bbox
+        ):
+            matches.append(door)
 
     if not matches:
         centroid = _area_centroid(area)
@@ -852,15 +1150,17 @@ def find_entry_door_in_area(area, view):
 
 
 def main():
+    _SYMBOL_MATCH_CACHE.clear()
     base_view = doc.ActiveView
     if not isinstance(base_view, DB.ViewPlan):
         uiutils.uiUtils_alert("Active view must be a plan view.", title="Make Marketing View")
         return
 
-    templates = [
-        v for v in DB.FilteredElementCollector(doc).OfClass(DB.View) if v.IsTemplate
-    ]
-    templates_sorted = sorted(templates, key=lambda v: v.Name)
+    # View templates are stored as View elements of the class they were made
+    # from, and only plan templates can be applied to a duplicated plan view.
+    views = DB.FilteredElementCollector(doc).OfClass(DB.ViewPlan).ToElements()
+    templates = [v for v in views if v.IsTemplate]
+    templates_sorted = sorted(templates, key=_get_name)
     keyplan_templates_sorted = list(templates_sorted)
 
     titleblocks = (
@@ -869,7 +1169,7 @@ def main():
         .WhereElementIsElementType()
         .ToElements()
     )
-    titleblocks_sorted = sorted(titleblocks, key=lambda t: "{}: {}".format(t.FamilyName, t.Name))
+    titleblocks_sorted = sorted(titleblocks, key=attrgetter("FamilyName", "Name"))
 
     fill_types = (
         DB.FilteredElementCollector(doc)
@@ -877,7 +1177,12 @@ def main():
         .WhereElementIsElementType()
         .ToElements()
     )
-    fill_types_sorted = sorted(fill_types, key=lambda f: f.Name)
+    fill_types_sorted = sorted(fill_types, key=_get_name)
+
+    # Keyplan templates are the same sorted list, so they share one index map.
+    template_idx_by_id = _index_by_id(templates_sorted)
+    titleblock_idx_by_id = _index_by_id(titleblocks_sorted)
+    fill_type_idx_by_id = _index_by_id(fill_types_sorted)
 
     if not templates_sorted:
         uiutils.uiUtils_alert("No view templates found for this view type.", title="Make Marketing View")
@@ -889,10 +1194,27 @@ def main():
         uiutils.uiUtils_alert("No titleblock types found.", title="Make Marketing View")
         return
 
+    # Doors in the base view are collected on first use (so cancelling the
+    # dialog skips the scan) and the entry door found for each area is reused
+    # for the picker, the saved config and the views.
+    doors = None
+    door_for_area = {}
+
+    def entry_door(area):
+        nonlocal doors
+        key = element_id_value(area.Id)
+        if key not in door_for_area:
+            if doors is None:
+                doors = collect_doors(base_view)
+            door_for_area[key] = find_entry_door_in_area(area, base_view, doors)
+        return door_for_area[key]
+
     config = script.get_config()
     state = {
         "area": None,
         "areas": [],
+        "area_ids": [],
+        "area_names": [],
         "door": None,
         "area_label": None,
         "door_label": None,
@@ -909,45 +1231,32 @@ def main():
     last_area_id = getattr(config, CONFIG_LAST_AREA_ID, None)
     if last_area_id:
         area_elem = doc.GetElement(DB.ElementId(int(last_area_id)))
-        if element_is_category(area_elem, DB.BuiltInCategory.OST_Areas):
+        if element_is_category(area_elem, _BIC_AREAS_INT):
             state["area"] = area_elem
             state["areas"] = [area_elem]
-            state["area_label"] = area_elem.Name or area_elem.Id.IntegerValue
+            state["area_ids"] = [element_id_value(area_elem.Id)]
+            state["area_names"] = [area_elem.Name]
+            state["area_label"] = state["area_names"][0] or state["area_ids"][0]
 
     last_door_id = getattr(config, CONFIG_LAST_DOOR_ID, None)
     if last_door_id:
         door_elem = doc.GetElement(DB.ElementId(int(last_door_id)))
-        if element_is_category(door_elem, DB.BuiltInCategory.OST_Doors):
+        if element_is_category(door_elem, _BIC_DOORS_INT):
             state["door"] = door_elem
             state["door_label"] = door_elem.Name or door_elem.Id.IntegerValue
 
-    last_template_id = getattr(config, CONFIG_LAST_TEMPLATE_ID, None)
-    if last_template_id:
-        for idx, template in enumerate(templates_sorted):
-            if template.Id.IntegerValue == int(last_template_id):
-                state["template_index"] = idx
-                break
-
-    last_titleblock_id = getattr(config, CONFIG_LAST_TITLEBLOCK_ID, None)
-    if last_titleblock_id:
-        for idx, titleblock in enumerate(titleblocks_sorted):
-            if titleblock.Id.IntegerValue == int(last_titleblock_id):
-                state["titleblock_index"] = idx
-                break
-
-    last_keyplan_template_id = getattr(config, CONFIG_LAST_KEYPLAN_TEMPLATE_ID, None)
-    if last_keyplan_template_id:
-        for idx, template in enumerate(keyplan_templates_sorted):
-            if template.Id.IntegerValue == int(last_keyplan_template_id):
-                state["keyplan_template_index"] = idx
-                break
-
-    last_fill_type_id = getattr(config, CONFIG_LAST_FILL_TYPE_ID, None)
-    if last_fill_type_id:
-        for idx, fill_type in enumerate(fill_types_sorted):
-            if fill_type.Id.IntegerValue == int(last_fill_type_id):
-                state["fill_type_index"] = idx
-                break
+    state["template_index"] = _saved_index(
+        template_idx_by_id, getattr(config, CONFIG_LAST_TEMPLATE_ID, None)
+    )
+    state["titleblock_index"] = _saved_index(
+        titleblock_idx_by_id, getattr(config, CONFIG_LAST_TITLEBLOCK_ID, None)
+    )
+    state["keyplan_template_index"] = _saved_index(
+        template_idx_by_id, getattr(config, CONFIG_LAST_KEYPLAN_TEMPLATE_ID, None)
+    )
+    state["fill_type_index"] = _saved_index(
+        fill_type_idx_by_id, getattr(config, CONFIG_LAST_FILL_TYPE_ID, None)
+    )
 
     while True:
         form = MarketingViewForm(
@@ -966,16 +1275,21 @@ def main():
                 except OperationCanceledException:
                     continue
                 area = areas[0] if areas else None
+                # Read ids and names once per pick; labels and view names reuse them.
+                area_ids = [element_id_value(a.Id) for a in areas]
+                area_names = [a.Name for a in areas]
                 state["areas"] = areas
                 state["area"] = area
+                state["area_ids"] = area_ids
+                state["area_names"] = area_names
                 state["area_label"] = (
                     "{} areas selected".format(len(areas))
-                    if areas and len(areas) > 1
-                    else (area.Name or area.Id.IntegerValue if area else "(not selected)")
+                    if len(areas) > 1
+                    else (area_names[0] or area_ids[0] if area else "(not selected)")
                 )
                 state["sheet_number_param"] = None
                 state["sheet_name_param"] = None
-                door = find_entry_door_in_area(area, base_view) if area else None
+                door = entry_door(area) if area else None
                 state["door"] = door
                 state["door_label"] = door.Name if door else "(not selected)"
             continue
@@ -997,7 +1311,7 @@ def main():
         create_keyplan = form.selected_create_keyplan
 
         area_for_config = areas[0] if areas else None
-        door_for_config = find_entry_door_in_area(area_for_config, base_view) if area_for_config else None
+        door_for_config = entry_door(area_for_config) if area_for_config else None
         config.last_area_id = element_id_value(area_for_config.Id) if area_for_config else None
         config.last_door_id = element_id_value(door_for_config.Id) if door_for_config else None
         config.last_template_id = element_id_value(view_template.Id) if view_template else None
@@ -1013,60 +1327,90 @@ def main():
         script.save_config()
         break
 
+    area_names = state.get("area_names") or []
+    if len(area_names) != len(areas):
+        area_names = [a.Name for a in areas]
+
     results = []
-    with revit.Transaction("Make Marketing View"):
-        for area in areas:
+    existing_view_names = collect_view_names()
+    existing_sheet_by_number = collect_sheets_by_number()
+    view_name_hints = {}
+    sheet_number_hints = {}
+    # FilledRegion.Create copies the loops, so one list is refilled per area.
+    fill_loops = List[DB.CurveLoop]()
+    # Every sheet uses the same titleblock type, so its bounds are read from
+    # the first sheet and reused.
+    tb_bounds = None
+    # Viewport outlines are only valid after a regenerate, so viewports are
+    # positioned in a second pass after a single regenerate for the batch.
+    placements = []
+    # The whole batch is one transaction (one undo step); helpers called from
+    # the loop must not open transactions of their own.
+    txn = DB.Transaction(doc, "Make Marketing View")
+    fail_opts = txn.GetFailureHandlingOptions()
+    fail_opts.SetFailuresPreprocessor(_WarningSwallower())
+    fail_opts.SetClearAfterRollback(True)
+    txn.SetFailureHandlingOptions(fail_opts)
+    txn.Start()
+    try:
+        for area, area_name in zip(areas, area_names):
+            # Check the boundary before naming, so no unique name or number is
+            # reserved (and its suffix hint advanced) for an area that is skipped.
+            loop = get_outer_boundary_loop(area)
+            if not loop:
+                results.append(
+                    _SheetResult(
+                        area,
+                        warnings=["Could not get a closed boundary loop from the selected area."],
+                        failed=True,
+                    )
+                )
+                continue
+
             sheet_number = get_param_value(area, sheet_number_param)
             if not sheet_number:
                 sheet_number = getattr(area, "Number", "") or ""
             sheet_name = get_param_value(area, sheet_name_param)
             if not sheet_name:
-                sheet_name = area.Name or "Marketing Sheet"
+                sheet_name = area_name or "Marketing Sheet"
 
-            base_label = sheet_name or area.Name or getattr(area, "Number", "") or "Marketing"
+            base_label = sheet_name or area_name or getattr(area, "Number", "") or "Marketing"
             view_name_base = "Marketing - {}".format(base_label)
-            view_name = unique_view_name(view_name_base)
 
-            existing_sheet = None
-            if sheet_number:
-                for sheet in DB.FilteredElementCollector(doc).OfClass(DB.ViewSheet):
-                    if sheet.SheetNumber == sheet_number:
-                        existing_sheet = sheet
-                        break
+            existing_sheet = existing_sheet_by_number.get(sheet_number) if sheet_number else None
 
+            # Pick the primary or "copy" base first; only the name actually
+            # used is passed through the hinted uniqueness search.
             if existing_sheet and not overwrite_existing:
-                sheet_number = unique_sheet_number(sheet_number)
-                view_name = unique_view_name("{} - copy".format(view_name_base))
-
-            loop = get_outer_boundary_loop(area)
-            if not loop:
-                results.append(
-                    {
-                        "area": area,
-                        "warnings": ["Could not get a closed boundary loop from the selected area."],
-                        "failed": True,
-                    }
+                sheet_number = unique_sheet_number(
+                    sheet_number, existing_sheet_by_number, sheet_number_hints
                 )
-                continue
+                view_name_base = "{} - copy".format(view_name_base)
+            view_name = unique_view_name(view_name_base, existing_view_names, view_name_hints)
 
-            door = find_entry_door_in_area(area, base_view)
+            door = entry_door(area)
             create_errors = []
 
             if overwrite_existing and existing_sheet:
                 doc.Delete(existing_sheet.Id)
+                existing_sheet_by_number.pop(sheet_number, None)
                 existing_sheet = None
             new_view_id = base_view.Duplicate(DB.ViewDuplicateOption.Duplicate)
             marketing_view = doc.GetElement(new_view_id)
             marketing_view.Name = view_name
+            existing_view_names.add(view_name)
             marketing_view.ViewTemplateId = view_template.Id
 
             clear_scope_box(marketing_view)
             marketing_view.CropBoxActive = True
-            marketing_view.CropBoxVisible = True
+            # rotate_view_to_door turns the crop box on itself so it knows
+            # whether a regenerate is needed before finding the crop element.
             if door:
                 rotated, rotate_msg = rotate_view_to_door(marketing_view, door)
             else:
                 rotated, rotate_msg = False, "No entry door found for this area."
+            if not marketing_view.CropBoxVisible:
+                marketing_view.CropBoxVisible = True
 
             crop_mgr = marketing_view.GetCropRegionShapeManager()
             try:
@@ -1088,11 +1432,14 @@ def main():
             if create_keyplan and keyplan_template and keyplan_fill_type:
                 keyplan_view_id = base_view.Duplicate(DB.ViewDuplicateOption.Duplicate)
                 keyplan_view = doc.GetElement(keyplan_view_id)
-                keyplan_view.Name = unique_view_name("Keyplan - {}".format(base_label))
+                keyplan_view.Name = unique_view_name(
+                    "Keyplan - {}".format(base_label), existing_view_names, view_name_hints
+                )
+                existing_view_names.add(keyplan_view.Name)
                 keyplan_view.ViewTemplateId = keyplan_template.Id
                 keyplan_view.CropBoxActive = True
                 keyplan_view.CropBoxVisible = True
-                fill_loops = List[DB.CurveLoop]()
+                fill_loops.Clear()
                 try:
                     fill_loops.Add(loop)
                     DB.FilledRegion.Create(doc, keyplan_fill_type.Id, keyplan_view.Id, fill_loops)
@@ -1100,7 +1447,7 @@ def main():
                     fallback_loop = _rect_loop_from_bbox(area.get_BoundingBox(base_view))
                     if fallback_loop:
                         try:
-                            fill_loops = List[DB.CurveLoop]()
+                            fill_loops.Clear()
                             fill_loops.Add(fallback_loop)
                             DB.FilledRegion.Create(
                                 doc, keyplan_fill_type.Id, keyplan_view.Id, fill_loops
@@ -1119,6 +1466,7 @@ def main():
                     sheet.SheetNumber = sheet_number
                 except Exception:
                     create_errors.append("Sheet number '{}' could not be set.".format(sheet_number))
+            existing_sheet_by_number[sheet.SheetNumber] = sheet
             if sheet_name:
                 try:
                     sheet.Name = sheet_name
@@ -1126,130 +1474,110 @@ def main():
                     create_errors.append("Sheet name '{}' could not be set.".format(sheet_name))
 
             if DB.Viewport.CanAddViewToSheet(doc, sheet.Id, marketing_view.Id):
-                bounds_min, bounds_max = _get_titleblock_bounds(sheet)
-                center = DB.XYZ(
-                    (bounds_min.X + bounds_max.X) / 2.0,
-                    (bounds_min.Y + bounds_max.Y) / 2.0,
-                    0.0,
-                )
-                offset = (bounds_max.X - bounds_min.X) * 0.25 if create_keyplan else 0.0
-                marketing_pt = DB.XYZ(center.X - offset, center.Y, 0.0)
+                if tb_bounds is None:
+                    bounds_min, bounds_max = _get_titleblock_bounds(sheet)
+                    tb_bounds = (bounds_min.X, bounds_min.Y, bounds_max.X, bounds_max.Y)
+                xmin, ymin, xmax, ymax = tb_bounds
+                cx = (xmin + xmax) / 2.0
+                cy = (ymin + ymax) / 2.0
+                offset = (xmax - xmin) * 0.25 if create_keyplan else 0.0
+                marketing_x = cx - offset
+                keyplan_x = cx + offset
+                marketing_pt = DB.XYZ(marketing_x, cy, 0.0)
                 marketing_vp = DB.Viewport.Create(doc, sheet.Id, marketing_view.Id, marketing_pt)
                 if isinstance(marketing_vp, DB.ElementId):
                     marketing_vp = doc.GetElement(marketing_vp)
                 if marketing_vp:
-                    doc.Regenerate()
+                    keyplan_vp = None
                     if create_keyplan and keyplan_view:
-                        keyplan_pt = DB.XYZ(center.X + offset, center.Y, 0.0)
+                        keyplan_pt = DB.XYZ(keyplan_x, cy, 0.0)
                         if DB.Viewport.CanAddViewToSheet(doc, sheet.Id, keyplan_view.Id):
                             keyplan_vp = DB.Viewport.Create(
                                 doc, sheet.Id, keyplan_view.Id, keyplan_pt
                             )
                             if isinstance(keyplan_vp, DB.ElementId):
                                 keyplan_vp = doc.GetElement(keyplan_vp)
-                            if keyplan_vp:
-                                doc.Regenerate()
-                                margin = (bounds_max.X - bounds_min.X) * 0.02
-                                marketing_half = _viewport_half_size(marketing_vp)
-                                keyplan_half = _viewport_half_size(keyplan_vp)
-                                if marketing_half and keyplan_half:
-                                    marketing_target = DB.XYZ(
-                                        bounds_min.X + marketing_half[0] + margin,
-                                        center.Y,
-                                        0.0,
-                                    )
-                                    keyplan_target = DB.XYZ(
-                                        bounds_max.X - keyplan_half[0] - margin,
-                                        center.Y,
-                                        0.0,
-                                    )
-                                    _clamp_viewport_center(
-                                        marketing_vp, marketing_target, bounds_min, bounds_max
-                                    )
-                                    _clamp_viewport_center(
-                                        keyplan_vp, keyplan_target, bounds_min, bounds_max
-                                    )
-                                else:
-                                    _clamp_viewport_center(
-                                        marketing_vp, marketing_pt, bounds_min, bounds_max
-                                    )
-                                    _clamp_viewport_center(
-                                        keyplan_vp, keyplan_pt, bounds_min, bounds_max
-                                    )
-                        else:
-                            _clamp_viewport_center(
-                                marketing_vp, marketing_pt, bounds_min, bounds_max
-                            )
-                            keyplan_vp = None
-                    else:
-                        _clamp_viewport_center(marketing_vp, marketing_pt, bounds_min, bounds_max)
+                    placements.append((marketing_vp, marketing_x, keyplan_vp, keyplan_x, cy))
 
             if not rotated:
                 create_errors.append("Rotation failed: {}".format(rotate_msg))
 
             results.append(
-                {
-                    "area": area,
-                    "sheet": sheet,
-                    "marketing_view": marketing_view,
-                    "keyplan_view": keyplan_view,
-                    "warnings": create_errors,
-                    "failed": False,
-                }
+                _SheetResult(area, sheet, marketing_view, keyplan_view, create_errors)
             )
 
+        if placements:
+            doc.Regenerate()
+            xmin, ymin, xmax, ymax = tb_bounds
+            margin = (xmax - xmin) * 0.02
+            # Each viewport outline is read once; the half size feeds both the
+            # side-by-side target and the clamp, which runs for all viewports at once.
+            layout_vps = []
+            layout = []
+            for marketing_vp, marketing_x, keyplan_vp, keyplan_x, cy in placements:
+                marketing_half = _viewport_half_size(marketing_vp)
+                keyplan_half = _viewport_half_size(keyplan_vp) if keyplan_vp else None
+                if marketing_half and keyplan_half:
+                    marketing_x = xmin + marketing_half[0] + margin
+                    keyplan_x = xmax - keyplan_half[0] - margin
+                for vp, target_x, half in (
+                    (marketing_vp, marketing_x, marketing_half),
+                    (keyplan_vp, keyplan_x, keyplan_half),
+                ):
+                    if vp is None:
+                        continue
+                    if half is None:
+                        vp.SetBoxCenter(DB.XYZ(target_x, cy, 0.0))
+                        continue
+                    layout_vps.append(vp)
+                    layout.append((target_x, cy, half[0], half[1]))
+            if layout:
+                centers = _clamped_centers(layout, tb_bounds)
+                for vp, (center_x, center_y) in zip(layout_vps, centers):
+                    vp.SetBoxCenter(DB.XYZ(center_x, center_y, 0.0))
+        txn.Commit()
+    except Exception:
+        if txn.HasStarted() and not txn.HasEnded():
+            txn.RollBack()
+        raise
+
+    created = []
+    failed = []
+    warnings = set()
     last_sheet = None
-    last_marketing = None
-    last_keyplan = None
     for result in results:
-        if result.get("sheet"):
-            last_sheet = result.get("sheet")
-            last_marketing = result.get("marketing_view")
-            last_keyplan = result.get("keyplan_view")
-
+        sheet = result.sheet
+        if sheet:
+            created.append(result)
+            last_sheet = sheet
+        if result.failed:
+            failed.append(result)
+        warnings.update(result.warnings)
+
+    # Only the last sheet is left open; switching through its views first
+    # would be replaced immediately by the sheet.
     try:
-        if last_marketing:
-            try:
-                uidoc.RequestViewChange(last_marketing)
-            except Exception:
-                uidoc.ActiveView = last_marketing
-        if last_keyplan:
-            try:
-                uidoc.RequestViewChange(last_keyplan)
-            except Exception:
-                uidoc.ActiveView = last_keyplan
         if last_sheet:
             try:
                 uidoc.RequestViewChange(last_sheet)
-                uidoc.ActiveView = last_sheet
                 uidoc.RefreshActiveView()
             except Exception:
                 uidoc.ActiveView = last_sheet
     except Exception:
         pass
 
-    created = [r for r in results if r.get("sheet")]
-    failed = [r for r in results if r.get("failed")]
-    warnings = []
-    for result in results:
-        for warning in result.get("warnings") or []:
-            warnings.append(warning)
-
     lines = ["Created {} sheet(s):".format(len(created))]
     for result in created:
-        sheet = result.get("sheet")
-        area = result.get("area")
-        sheet_number = _report_sheet_number(sheet)
-        lines.append("- {} ({})".format(sheet_number, _safe_elem_label(area)))
+        sheet_number = _report_sheet_number(result.sheet)
+        lines.append("- {} ({})".format(sheet_number, _safe_elem_label(result.area)))
     if failed:
         lines.append("")
         lines.append("Failed {} area(s):".format(len(failed)))
         for result in failed:
-            area = result.get("area")
-            lines.append("- {}".format(_safe_elem_label(area)))
+            lines.append("- {}".format(_safe_elem_label(result.area)))
     message = "\n".join(lines)
     if warnings:
-        message += "\n\nWarnings:\n" + "\n".join(sorted(set(warnings)))
+        message += "\n\nWarnings:\n" + "\n".join(sorted(warnings))
     uiutils.uiUtils_alert(message, title="Marketing Sheets Created")
 
 
@@ -1,16 +1,28 @@
 # import pyrevit libraries
 import clr
-from pyrevit import forms,script
+from pyrevit import script
 from WWP_msgUtils import *
 
 # check if notifications are disabled
 if msgUtils_muted():
 	script.exit()
 
+# forms loads the WPF assemblies, so only import it when the toast is shown
+from System import EventHandler
+from Autodesk.Revit.UI.Events import IdlingEventArgs
+from pyrevit import forms
+
 # Get icon file (doesn't work)
 # curPath = script.get_script_path()
 # remPath = curPath.split('WWPTools.tab')[0]
 # icoFile = remPath + r'bin\Graphics\ico256_WWP.ico'
 
-# Display the message to the user
-forms.toast("Toolbar has been loaded!","WWP_Tool",appid="WWP Architects + Planners",actions=None)
+# Display the message to the user once Revit is idle, so startup is not held up
+# sender is the UIApplication; the __revit__ builtin may be gone by the time
+# Idling fires, after this hook has finished running
+def show_toast(sender, args):
+	sender.Idling -= toast_handler
+	forms.toast("Toolbar has been loaded!","WWP_Tool",appid="WWP Architects + Planners",actions=None)
+
+toast_handler = EventHandler[IdlingEventArgs](show_toast)
+__revit__.Idling += toast_handler
@@ -8,45 +8,22 @@ if msgUtils_muted():
 
 # import libraries
 from pyrevit import forms
-from datetime import datetime
 import math
+import time
 
 # get the time
-time = datetime.now()
-dt_f2 = time.strftime("%Y-%m-%d %H-%M-%S")
-
-# try to write data
-# Get a datetime
-dt_f1  = script.load_data("Sync start", this_project=True)
-
-def getdhms(dt_f):
-    date_str = dt_f.split(" ")[0]
-    time_str = dt_f.split(" ")[1]
-    day = date_str.split("-")[2]
-    hour= time_str.split("-")[0]
-    minute = time_str.split("-")[1]
-    second = time_str.split("-")[2]
-    timelst = [day,hour,minute,second]
-    return timelst
-
-def diff(la,lb):
-    d=(int(lb[0])-int(la[0]))*60*60*24
-    h=(int(lb[1])-int(la[1]))*60*60
-    m=(int(lb[2])-int(la[2]))*60
-    s=int(lb[3])-int(la[3])
-    return d+h+m+s
+sync_end = time.time()
 
 def timeToString(s):
 	unpad = str(s).split(".")[0]
 	return unpad.rjust(2,"0")
 
-# Break down to parts
-before = getdhms(dt_f1)
-after = getdhms(dt_f2)
 msg = ""
 
 try:
-	elapsed = diff(before, after)
+	# Sync start is stored by doc-syncing as epoch seconds
+	sync_start = float(script.load_data("Sync start", this_project=True))
+	elapsed = int(sync_end - sync_start)
 	e_mins  = math.floor(elapsed/60)
 	e_secs  = elapsed % 60
 	if e_mins < 1:
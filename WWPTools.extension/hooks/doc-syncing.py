@@ -3,14 +3,10 @@ from pyrevit import script
 from WWP_msgUtils import *
 
 # import libraries
-from datetime import datetime
+import time
 
-# get the time
-time = datetime.now()
-dt_f = time.strftime("%Y-%m-%d %H-%M-%S")
-
-# try to write data
+# try to write data (epoch seconds, formatted by doc-synced)
 try:
-	script.store_data("Sync start", dt_f, this_project=True)
-except:
+	script.store_data("Sync start", time.time(), this_project=True)
+except Exception:
 	pass
\ No newline at end of file